@@ -3,41 +3,61 @@ import json
 from PyQt6.QtWidgets import (
     QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QPushButton,
     QLabel, QLineEdit, QTextEdit, QMessageBox, QListWidget,
-    QDialog, QDialogButtonBox, QFormLayout, QTabWidget, QSplitter
+    QDialog, QDialogButtonBox, QFormLayout, QTabWidget, QSplitter,
+    QAbstractItemView, QComboBox, QInputDialog
 )
-from PyQt6.QtCore import Qt, QPropertyAnimation, QEasingCurve, QRect, QSize
-from PyQt6.QtGui import QIcon, QFont, QColor, QPalette
+from PyQt6.QtCore import (
+    Qt, QPropertyAnimation, QEasingCurve, QRect, QSize,
+    QItemSelection, QItemSelectionModel
+)
+from PyQt6.QtGui import QIcon, QFont, QColor, QPalette, QKeySequence, QShortcut
 from app.encryption import EncryptionHandler
 from app.resources import get_app_icon
 
 
+DIALOG_STYLE = """
+    QDialog {
+        background-color: #f5f5f5;
+        border-radius: 10px;
+    }
+    QLineEdit, QTextEdit, QComboBox {
+        padding: 8px;
+        border: 1px solid #ddd;
+        border-radius: 4px;
+        background-color: white;
+    }
+    QPushButton {
+        background-color: #4a86e8;
+        color: white;
+        border: none;
+        padding: 8px 16px;
+        border-radius: 4px;
+    }
+    QPushButton:hover {
+        background-color: #3a76d8;
+    }
+"""
+
+# Maximum number of undo steps kept in memory
+UNDO_LIMIT = 50
+
+
+def parse_tags(text):
+    """Split a comma-separated tag string into a list of unique tags"""
+    tags = []
+    for tag in text.split(","):
+        tag = tag.strip()
+        if tag and tag not in tags:
+            tags.append(tag)
+    return tags
+
+
 class AddPasswordDialog(QDialog):
     def __init__(self, parent=None):
         super().__init__(parent)
         self.setWindowTitle("Add Password Entry")
         self.resize(400, 300)
-        self.setStyleSheet("""
-            QDialog {
-                background-color: #f5f5f5;
-                border-radius: 10px;
-            }
-            QLineEdit, QTextEdit {
-                padding: 8px;
-                border: 1px solid #ddd;
-                border-radius: 4px;
-                background-color: white;
-            }
-            QPushButton {
-                background-color: #4a86e8;
-                color: white;
-                border: none;
-                padding: 8px 16px;
-                border-radius: 4px;
-            }
-            QPushButton:hover {
-                background-color: #3a76d8;
-            }
-        """)
+        self.setStyleSheet(DIALOG_STYLE)
         
         layout = QVBoxLayout(self)
         
@@ -60,6 +80,10 @@ class AddPasswordDialog(QDialog):
         self.notes_edit.setPlaceholderText("Additional notes (optional)")
         form_layout.addRow("Notes:", self.notes_edit)
         
+        self.tags_edit = QLineEdit()
+        self.tags_edit.setPlaceholderText("Comma-separated tags (optional)")
+        form_layout.addRow("Tags:", self.tags_edit)
+        
         layout.addLayout(form_layout)
         
         button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
@@ -72,10 +96,70 @@ class AddPasswordDialog(QDialog):
             "title": self.title_edit.text(),
             "username": self.username_edit.text(),
             "password": self.password_edit.text(),
-            "notes": self.notes_edit.toPlainText()
+            "notes": self.notes_edit.toPlainText(),
+            "tags": parse_tags(self.tags_edit.text())
         }
 
 
+class BulkEditDialog(QDialog):
+    FIELDS = [
+        ("Title", "title"),
+        ("Username", "username"),
+        ("Password", "password"),
+        ("Notes", "notes"),
+        ("Tags", "tags")
+    ]
+    
+    def __init__(self, count, parent=None):
+        super().__init__(parent)
+        self.setWindowTitle("Edit Selected Entries")
+        self.resize(400, 200)
+        self.setStyleSheet(DIALOG_STYLE)
+        
+        layout = QVBoxLayout(self)
+        
+        layout.addWidget(QLabel(f"Set a field on {count} selected entries:"))
+        
+        form_layout = QFormLayout()
+        
+        self.field_combo = QComboBox()
+        for label, field in self.FIELDS:
+            self.field_combo.addItem(label, field)
+        self.field_combo.currentIndexChanged.connect(self.on_field_changed)
+        form_layout.addRow("Field:", self.field_combo)
+        
+        self.value_edit = QLineEdit()
+        form_layout.addRow("New value:", self.value_edit)
+        
+        layout.addLayout(form_layout)
+        
+        button_box = QDialogButtonBox(QDialogButtonBox.StandardButton.Ok | QDialogButtonBox.StandardButton.Cancel)
+        button_box.accepted.connect(self.accept)
+        button_box.rejected.connect(self.reject)
+        layout.addWidget(button_box)
+        
+        self.on_field_changed()
+    
+    def on_field_changed(self):
+        field = self.field_combo.currentData()
+        if field == "password":
+            self.value_edit.setEchoMode(QLineEdit.EchoMode.Password)
+        else:
+            self.value_edit.setEchoMode(QLineEdit.EchoMode.Normal)
+        
+        if field == "tags":
+            self.value_edit.setPlaceholderText("Comma-separated tags, empty to clear")
+        else:
+            self.value_edit.setPlaceholderText("")
+    
+    def get_change(self):
+        field = self.field_combo.currentData()
+        value = self.value_edit.text()
+        if field == "tags":
+            value = parse_tags(value)
+        return field, value
+
+
 class MainWindow(QMainWindow):
     def __init__(self):
         super().__init__()
@@ -84,6 +168,7 @@ class MainWindow(QMainWindow):
         self.data_file = "encrypted_passwords.dat"
         self.password_entries = []
         self.current_entry_index = -1
+        self.undo_stack = []
         
         self.setWindowTitle("Secure Password Manager")
         self.resize(900, 600)
@@ -231,7 +316,9 @@ class MainWindow(QMainWindow):
         left_layout.addWidget(list_label)
         
         self.entry_list = QListWidget()
+        self.entry_list.setSelectionMode(QAbstractItemView.SelectionMode.ExtendedSelection)
         self.entry_list.currentRowChanged.connect(self.on_entry_selected)
+        self.entry_list.itemSelectionChanged.connect(self.update_action_buttons)
         left_layout.addWidget(self.entry_list)
         
         # Buttons for managing entries
@@ -251,6 +338,19 @@ class MainWindow(QMainWindow):
         self.delete_button.setEnabled(False)
         buttons_layout.addWidget(self.delete_button)
         
+        self.tag_button = QPushButton("Tag")
+        self.tag_button.clicked.connect(self.tag_password_entries)
+        self.tag_button.setEnabled(False)
+        buttons_layout.addWidget(self.tag_button)
+        
+        self.undo_button = QPushButton("Undo")
+        self.undo_button.clicked.connect(self.undo)
+        self.undo_button.setEnabled(False)
+        buttons_layout.addWidget(self.undo_button)
+        
+        undo_shortcut = QShortcut(QKeySequence(QKeySequence.StandardKey.Undo), self.app_widget)
+        undo_shortcut.activated.connect(self.undo)
+        
         left_layout.addLayout(buttons_layout)
         
         # Right panel with password details
@@ -290,6 +390,9 @@ class MainWindow(QMainWindow):
         self.notes_label.setReadOnly(True)
         form_layout.addRow("Notes:", self.notes_label)
         
+        self.tags_label = QLabel("")
+        form_layout.addRow("Tags:", self.tags_label)
+        
         self.right_layout.addLayout(form_layout)
         
         # Add panels to splitter
@@ -325,6 +428,7 @@ class MainWindow(QMainWindow):
                 if decrypted_data:
                     self.master_password = password
                     self.password_entries = json.loads(decrypted_data)
+                    self.undo_stack = []
                     self.update_entry_list()
                     self.show_app_interface()
                 else:
@@ -343,6 +447,7 @@ class MainWindow(QMainWindow):
             if reply == QMessageBox.StandardButton.Yes:
                 self.master_password = password
                 self.password_entries = []
+                self.undo_stack = []
                 self.save_data()
                 self.show_app_interface()
             else:
@@ -392,6 +497,7 @@ class MainWindow(QMainWindow):
             
             self.master_password = password
             self.password_entries = []
+            self.undo_stack = []
             self.save_data()
             self.show_app_interface()
     
@@ -425,10 +531,9 @@ class MainWindow(QMainWindow):
             self.username_label.setText(entry["username"])
             self.password_label.setText(entry["password"])
             self.notes_label.setText(entry["notes"])
+            self.tags_label.setText(", ".join(entry.get("tags", [])))
             
-            # Enable edit and delete buttons
-            self.edit_button.setEnabled(True)
-            self.delete_button.setEnabled(True)
+            self.update_action_buttons()
         else:
             self.clear_details()
     
@@ -437,48 +542,153 @@ class MainWindow(QMainWindow):
         self.username_label.setText("")
         self.password_label.setText("")
         self.notes_label.setText("")
-        self.edit_button.setEnabled(False)
-        self.delete_button.setEnabled(False)
+        self.tags_label.setText("")
+        self.update_action_buttons()
+    
+    def selected_entry_indexes(self):
+        """Return the sorted indexes of all selected entries"""
+        rows = {index.row() for index in self.entry_list.selectedIndexes()}
+        return sorted(row for row in rows if row < len(self.password_entries))
+    
+    def select_entries(self, indexes):
+        """Select the given entries with a single selection change"""
+        indexes = [index for index in indexes if index < self.entry_list.count()]
+        if not indexes:
+            return
+        
+        self.entry_list.setCurrentRow(indexes[0])
+        model = self.entry_list.model()
+        selection = QItemSelection()
+        for row in indexes:
+            model_index = model.index(row, 0)
+            selection.select(model_index, model_index)
+        self.entry_list.selectionModel().select(
+            selection, QItemSelectionModel.SelectionFlag.ClearAndSelect
+        )
+    
+    def update_action_buttons(self):
+        has_selection = len(self.selected_entry_indexes()) > 0
+        self.edit_button.setEnabled(has_selection)
+        self.delete_button.setEnabled(has_selection)
+        self.tag_button.setEnabled(has_selection)
+        self.undo_button.setEnabled(len(self.undo_stack) > 0)
+    
+    def push_undo_state(self):
+        # Entries are replaced rather than modified in place,
+        # so a shallow copy of the list is a complete snapshot
+        self.undo_stack.append(list(self.password_entries))
+        del self.undo_stack[:-UNDO_LIMIT]
+        self.undo_button.setEnabled(True)
+    
+    def undo(self):
+        if not self.undo_stack or not self.master_password:
+            return
+        
+        self.password_entries = self.undo_stack.pop()
+        self.update_entry_list()
+        self.current_entry_index = -1
+        self.clear_details()
+        self.save_data()
     
     def add_password_entry(self):
         dialog = AddPasswordDialog(self)
         if dialog.exec() == QDialog.DialogCode.Accepted:
             entry_data = dialog.get_entry_data()
+            self.push_undo_state()
             self.password_entries.append(entry_data)
             self.update_entry_list()
             self.save_data()
     
     def edit_password_entry(self):
-        if self.current_entry_index < 0:
+        selected = self.selected_entry_indexes()
+        if len(selected) > 1:
+            self.bulk_edit_password_entries(selected)
             return
         
-        current_entry = self.password_entries[self.current_entry_index]
+        index = selected[0] if selected else self.current_entry_index
+        if index < 0:
+            return
+        
+        current_entry = self.password_entries[index]
         dialog = AddPasswordDialog(self)
         dialog.title_edit.setText(current_entry["title"])
         dialog.username_edit.setText(current_entry["username"])
         dialog.password_edit.setText(current_entry["password"])
         dialog.notes_edit.setText(current_entry["notes"])
+        dialog.tags_edit.setText(", ".join(current_entry.get("tags", [])))
         
         if dialog.exec() == QDialog.DialogCode.Accepted:
             entry_data = dialog.get_entry_data()
-            self.password_entries[self.current_entry_index] = entry_data
+            self.push_undo_state()
+            self.password_entries[index] = entry_data
             self.update_entry_list()
-            self.entry_list.setCurrentRow(self.current_entry_index)
+            self.entry_list.setCurrentRow(index)
             self.save_data()
     
+    def bulk_edit_password_entries(self, selected):
+        dialog = BulkEditDialog(len(selected), self)
+        if dialog.exec() != QDialog.DialogCode.Accepted:
+            return
+        
+        field, value = dialog.get_change()
+        self.apply_to_entries(selected, lambda entry: {**entry, field: value})
+    
+    def tag_password_entries(self):
+        selected = self.selected_entry_indexes()
+        if not selected:
+            return
+        
+        text, ok = QInputDialog.getText(
+            self,
+            "Tag Entries",
+            f"Tags to add to {len(selected)} selected entries (comma-separated):"
+        )
+        new_tags = parse_tags(text)
+        if not ok or not new_tags:
+            return
+        
+        def add_tags(entry):
+            tags = list(entry.get("tags", []))
+            tags.extend(tag for tag in new_tags if tag not in tags)
+            return {**entry, "tags": tags}
+        
+        self.apply_to_entries(selected, add_tags)
+    
+    def apply_to_entries(self, indexes, update):
+        """Replace each entry at `indexes` with `update(entry)` as one undoable change"""
+        self.push_undo_state()
+        for index in indexes:
+            self.password_entries[index] = update(self.password_entries[index])
+        self.update_entry_list()
+        self.select_entries(indexes)
+        self.save_data()
+    
     def delete_password_entry(self):
-        if self.current_entry_index < 0:
+        selected = self.selected_entry_indexes()
+        if not selected and self.current_entry_index >= 0:
+            selected = [self.current_entry_index]
+        if not selected:
             return
         
+        if len(selected) == 1:
+            message = f"Are you sure you want to delete '{self.password_entries[selected[0]]['title']}'?"
+        else:
+            message = f"Are you sure you want to delete {len(selected)} entries?"
+        
         reply = QMessageBox.question(
             self, 
             "Confirm Deletion", 
-            f"Are you sure you want to delete '{self.password_entries[self.current_entry_index]['title']}'?",
+            message,
             QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
         )
         
         if reply == QMessageBox.StandardButton.Yes:
-            del self.password_entries[self.current_entry_index]
+            self.push_undo_state()
+            selected = set(selected)
+            self.password_entries = [
+                entry for index, entry in enumerate(self.password_entries)
+                if index not in selected
+            ]
             self.update_entry_list()
             self.current_entry_index = -1
             self.clear_details()
@@ -518,6 +728,7 @@ class MainWindow(QMainWindow):
         # Clear sensitive data
         self.master_password = None
         self.password_entries = []
+        self.undo_stack = []
         self.current_entry_index = -1
         self.clear_details()
     
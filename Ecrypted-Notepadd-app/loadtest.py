@@ -0,0 +1,521 @@
+"""Headless load-test harness for the main window.
+
+Starts MainWindow on the Qt offscreen platform, loads synthetic vaults of
+configurable size and scripts unlock, scrolling, selection, add/edit/delete,
+bulk edit/tag/delete, undo and lock while measuring event-loop latency and
+memory. Results are written as a JSON report.
+
+Example:
+    python loadtest.py --sizes 100,1000,5000 --output report.json
+"""
+import os
+
+# Must be set before the QApplication is created
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+
+import sys
+import json
+import time
+import random
+import string
+import argparse
+import platform
+import tempfile
+import threading
+import tracemalloc
+
+from PyQt6.QtWidgets import QApplication, QDialog, QMessageBox, QInputDialog
+from PyQt6.QtCore import QTimer, QEventLoop, QElapsedTimer, QT_VERSION_STR, PYQT_VERSION_STR
+from app.encryption import EncryptionHandler
+from app.main_window import MainWindow, AddPasswordDialog, BulkEditDialog
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+MASTER_PASSWORD = "load-test-master-password"
+HEARTBEAT_MS = 5
+SETTLE_MS = 50
+LOCK_SETTLE_MS = 700
+BULK_SIZE = 100
+
+# Actions that change the vault and are expected to save it once
+MUTATING_ACTIONS = ("add", "edit", "delete", "bulk_edit", "bulk_tag", "bulk_delete", "undo")
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile of a list of numbers"""
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(1, int(round(pct / 100.0 * len(ordered))))
+    return ordered[min(rank, len(ordered)) - 1]
+
+
+def current_rss_kb():
+    """Resident set size of this process in KiB"""
+    try:
+        with open("/proc/self/statm") as f:
+            pages = int(f.read().split()[1])
+        return pages * os.sysconf("SC_PAGE_SIZE") // 1024
+    except (OSError, ValueError, AttributeError):
+        pass
+    if resource is not None:
+        # ru_maxrss is the peak, not the current value, but better than nothing
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return 0
+
+
+def random_text(rng, length):
+    return "".join(rng.choice(string.ascii_letters + string.digits) for _ in range(length))
+
+
+def make_entry(rng, index):
+    return {
+        "title": f"Site {index:06d} {random_text(rng, 8)}",
+        "username": f"user{index}@example.com",
+        "password": random_text(rng, 20),
+        "notes": random_text(rng, rng.randint(0, 200))
+    }
+
+
+def write_synthetic_vault(path, size, rng):
+    """Encrypt `size` generated entries into `path` with the master password"""
+    entries = [make_entry(rng, i) for i in range(size)]
+    encrypted_data = EncryptionHandler().encrypt_data(json.dumps(entries), MASTER_PASSWORD)
+    with open(path, "w") as f:
+        f.write(encrypted_data)
+
+
+class Counters:
+    """Counts calls to instrumented methods while an action runs"""
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.list_rebuilds = 0
+        self.saves = 0
+        self.kdf_calls = 0
+        self.gui_thread_kdf_calls = 0
+        self.warnings = []
+
+
+def instrument(counters):
+    """Wrap the methods whose call counts reveal known regressions"""
+    original_generate_key = EncryptionHandler.generate_key
+    original_update_entry_list = MainWindow.update_entry_list
+    original_save_data = MainWindow.save_data
+
+    def generate_key(self, password, salt=None):
+        counters.kdf_calls += 1
+        if threading.current_thread() is threading.main_thread():
+            counters.gui_thread_kdf_calls += 1
+        return original_generate_key(self, password, salt)
+
+    def update_entry_list(self, *args, **kwargs):
+        counters.list_rebuilds += 1
+        return original_update_entry_list(self, *args, **kwargs)
+
+    def save_data(self, *args, **kwargs):
+        counters.saves += 1
+        return original_save_data(self, *args, **kwargs)
+
+    EncryptionHandler.generate_key = generate_key
+    MainWindow.update_entry_list = update_entry_list
+    MainWindow.save_data = save_data
+
+
+class ScriptedDialogs:
+    """Replaces modal dialogs with scripted answers so nothing blocks"""
+
+    def __init__(self, counters):
+        self.counters = counters
+        self.entry_queue = []
+        self.bulk_change_queue = []
+        self.tag_queue = []
+
+        scripted = self
+
+        def exec_add_dialog(dialog):
+            if not scripted.entry_queue:
+                return QDialog.DialogCode.Rejected
+            entry = scripted.entry_queue.pop(0)
+            dialog.title_edit.setText(entry["title"])
+            dialog.username_edit.setText(entry["username"])
+            dialog.password_edit.setText(entry["password"])
+            dialog.notes_edit.setText(entry["notes"])
+            dialog.tags_edit.setText(", ".join(entry.get("tags", [])))
+            return QDialog.DialogCode.Accepted
+
+        def exec_bulk_edit_dialog(dialog):
+            if not scripted.bulk_change_queue:
+                return QDialog.DialogCode.Rejected
+            field, value = scripted.bulk_change_queue.pop(0)
+            dialog.field_combo.setCurrentIndex(dialog.field_combo.findData(field))
+            dialog.value_edit.setText(value)
+            return QDialog.DialogCode.Accepted
+
+        def get_text(*args, **kwargs):
+            if not scripted.tag_queue:
+                return "", False
+            return scripted.tag_queue.pop(0), True
+
+        def question(*args, **kwargs):
+            return QMessageBox.StandardButton.Yes
+
+        def warning(parent, title, text, *args, **kwargs):
+            scripted.counters.warnings.append(f"{title}: {text}")
+            return QMessageBox.StandardButton.Ok
+
+        AddPasswordDialog.exec = exec_add_dialog
+        BulkEditDialog.exec = exec_bulk_edit_dialog
+        QInputDialog.getText = staticmethod(get_text)
+        QMessageBox.question = staticmethod(question)
+        QMessageBox.warning = staticmethod(warning)
+
+    def queue_entry(self, entry):
+        self.entry_queue.append(entry)
+
+    def queue_bulk_change(self, field, value):
+        self.bulk_change_queue.append((field, value))
+
+    def queue_tags(self, text):
+        self.tag_queue.append(text)
+
+
+class EventLoopProbe:
+    """Measures event-loop latency with a fast repeating heartbeat timer.
+
+    Every gap between heartbeats beyond the timer interval is time the GUI
+    thread spent unable to process events.
+    """
+
+    def __init__(self, interval_ms=HEARTBEAT_MS):
+        self.interval_ms = interval_ms
+        self.clock = QElapsedTimer()
+        self.timer = QTimer()
+        self.timer.setInterval(interval_ms)
+        self.timer.timeout.connect(self._tick)
+        self.stalls = []
+        self.last_tick = 0
+
+    def _tick(self):
+        now = self.clock.nsecsElapsed() / 1e6
+        self.stalls.append(max(0.0, now - self.last_tick - self.interval_ms))
+        self.last_tick = now
+
+    def start(self):
+        self.stalls = []
+        self.clock.start()
+        self.last_tick = 0
+        self.timer.start()
+
+    def stop(self):
+        self.timer.stop()
+        # Account for a stall that is still running when the action ends
+        self._tick()
+        return self.stalls
+
+
+class ActionStats:
+    def __init__(self, name):
+        self.name = name
+        self.runs = 0
+        self.durations = []
+        self.stalls = []
+        self.list_rebuilds = 0
+        self.saves = 0
+        self.kdf_calls = 0
+        self.gui_thread_kdf_calls = 0
+        self.rss_delta_kb = 0
+        self.python_peak_kb = 0
+        self.warnings = []
+
+    def to_dict(self):
+        runs = max(self.runs, 1)
+        return {
+            "runs": self.runs,
+            "duration_ms": {
+                "mean": round(sum(self.durations) / runs, 3),
+                "max": round(max(self.durations, default=0.0), 3)
+            },
+            "stall_ms": {
+                "max": round(max(self.stalls, default=0.0), 3),
+                "p50": round(percentile(self.stalls, 50), 3),
+                "p95": round(percentile(self.stalls, 95), 3),
+                "p99": round(percentile(self.stalls, 99), 3)
+            },
+            "list_rebuilds_per_run": self.list_rebuilds / runs,
+            "saves_per_run": self.saves / runs,
+            "kdf_calls_per_run": self.kdf_calls / runs,
+            "gui_thread_kdf_calls_per_run": self.gui_thread_kdf_calls / runs,
+            "rss_delta_kb": self.rss_delta_kb,
+            "python_peak_kb": self.python_peak_kb,
+            "warnings": self.warnings
+        }
+
+
+class LoadTest:
+    def __init__(self, app, counters, dialogs, settle_ms=SETTLE_MS, track_python_memory=False):
+        self.app = app
+        self.counters = counters
+        self.dialogs = dialogs
+        self.settle_ms = settle_ms
+        self.track_python_memory = track_python_memory
+        self.probe = EventLoopProbe()
+
+    def run_action(self, stats, action, settle_ms=None):
+        """Run `action` from inside the event loop and record its cost"""
+        if settle_ms is None:
+            settle_ms = self.settle_ms
+
+        loop = QEventLoop()
+        elapsed = {}
+
+        def invoke():
+            started = time.perf_counter()
+            action()
+            elapsed["ms"] = (time.perf_counter() - started) * 1000
+            # Keep probing while deferred work (animations, repaints) runs
+            QTimer.singleShot(settle_ms, loop.quit)
+
+        self.counters.reset()
+        if self.track_python_memory:
+            tracemalloc.reset_peak()
+        rss_before = current_rss_kb()
+
+        self.probe.start()
+        QTimer.singleShot(0, invoke)
+        loop.exec()
+        stalls = self.probe.stop()
+
+        stats.runs += 1
+        stats.durations.append(elapsed.get("ms", 0.0))
+        stats.stalls.extend(stalls)
+        stats.list_rebuilds += self.counters.list_rebuilds
+        stats.saves += self.counters.saves
+        stats.kdf_calls += self.counters.kdf_calls
+        stats.gui_thread_kdf_calls += self.counters.gui_thread_kdf_calls
+        stats.rss_delta_kb += current_rss_kb() - rss_before
+        stats.warnings.extend(self.counters.warnings)
+        if self.track_python_memory:
+            _, peak = tracemalloc.get_traced_memory()
+            stats.python_peak_kb = max(stats.python_peak_kb, peak // 1024)
+
+    def select_random_rows(self, window, rng, count):
+        """Select up to `count` random rows in one selection change"""
+        rows = sorted(rng.sample(range(window.entry_list.count()), min(count, window.entry_list.count())))
+        window.select_entries(rows)
+        return rows
+
+    def run_vault(self, size, repeat, seed, bulk_size):
+        """Script a full session against a vault of `size` entries"""
+        rng = random.Random(seed)
+        actions = {}
+
+        def stats_for(name):
+            if name not in actions:
+                actions[name] = ActionStats(name)
+            return actions[name]
+
+        with tempfile.TemporaryDirectory() as tmp_dir:
+            data_file = os.path.join(tmp_dir, "encrypted_passwords.dat")
+            write_synthetic_vault(data_file, size, rng)
+
+            window = MainWindow()
+            window.data_file = data_file
+            window.show()
+            self.app.processEvents()
+            rss_start = current_rss_kb()
+
+            # Unlock
+            window.password_input.setText(MASTER_PASSWORD)
+            self.run_action(stats_for("unlock"), window.authenticate, LOCK_SETTLE_MS)
+            loaded = len(window.password_entries)
+
+            # Scroll the list from top to bottom
+            scroll_bar = window.entry_list.verticalScrollBar()
+
+            def scroll():
+                step = max(1, scroll_bar.pageStep())
+                for value in range(scroll_bar.minimum(), scroll_bar.maximum() + step, step):
+                    scroll_bar.setValue(value)
+                    self.app.processEvents()
+
+            for _ in range(repeat):
+                scroll_bar.setValue(scroll_bar.minimum())
+                self.run_action(stats_for("scroll"), scroll)
+
+            # Select entries; the list routes the change through on_entry_selected
+            for _ in range(repeat):
+                row = rng.randrange(max(window.entry_list.count(), 1))
+                self.run_action(
+                    stats_for("select"),
+                    lambda row=row: window.entry_list.setCurrentRow(row)
+                )
+
+            # Add entries
+            for i in range(repeat):
+                self.dialogs.queue_entry(make_entry(rng, size + i))
+                self.run_action(stats_for("add"), window.add_password_entry)
+
+            # Edit entries
+            for _ in range(repeat):
+                row = rng.randrange(window.entry_list.count())
+                window.entry_list.setCurrentRow(row)
+                edited = dict(window.password_entries[row])
+                edited["username"] = f"edited-{random_text(rng, 6)}@example.com"
+                self.dialogs.queue_entry(edited)
+                self.run_action(stats_for("edit"), window.edit_password_entry)
+
+            # Delete entries
+            for _ in range(repeat):
+                if window.entry_list.count() == 0:
+                    break
+                window.entry_list.setCurrentRow(rng.randrange(window.entry_list.count()))
+                self.run_action(stats_for("delete"), window.delete_password_entry)
+
+            # Bulk edit a field across many entries
+            for _ in range(repeat):
+                self.select_random_rows(window, rng, bulk_size)
+                self.dialogs.queue_bulk_change("username", f"bulk-{random_text(rng, 6)}@example.com")
+                self.run_action(stats_for("bulk_edit"), window.edit_password_entry)
+
+            # Bulk tag
+            for _ in range(repeat):
+                self.select_random_rows(window, rng, bulk_size)
+                self.dialogs.queue_tags(f"tag-{random_text(rng, 4)}")
+                self.run_action(stats_for("bulk_tag"), window.tag_password_entries)
+
+            # Bulk delete, then undo it
+            for _ in range(repeat):
+                if window.entry_list.count() == 0:
+                    break
+                self.select_random_rows(window, rng, bulk_size)
+                self.run_action(stats_for("bulk_delete"), window.delete_password_entry)
+                self.run_action(stats_for("undo"), window.undo)
+
+            # Lock
+            self.run_action(stats_for("lock"), window.lock_application, LOCK_SETTLE_MS)
+
+            rss_end = current_rss_kb()
+            window.close()
+            window.deleteLater()
+            self.app.processEvents()
+
+        return {
+            "entries": size,
+            "entries_loaded": loaded,
+            "rss_start_kb": rss_start,
+            "rss_end_kb": rss_end,
+            "actions": {name: stats.to_dict() for name, stats in actions.items()}
+        }
+
+
+def check_budgets(report, args):
+    """Return a list of budget violations for the report"""
+    violations = []
+    for run in report["runs"]:
+        for name, action in run["actions"].items():
+            where = f"{run['entries']} entries / {name}"
+            if args.max_stall_ms is not None and name not in args.exempt:
+                if action["stall_ms"]["max"] > args.max_stall_ms:
+                    violations.append(
+                        f"{where}: max stall {action['stall_ms']['max']} ms > {args.max_stall_ms} ms"
+                    )
+            if args.max_list_rebuilds is not None and name in MUTATING_ACTIONS:
+                if action["list_rebuilds_per_run"] > args.max_list_rebuilds:
+                    violations.append(
+                        f"{where}: {action['list_rebuilds_per_run']} full list rebuilds per run "
+                        f"> {args.max_list_rebuilds}"
+                    )
+            if args.max_saves is not None and name in MUTATING_ACTIONS:
+                if action["saves_per_run"] > args.max_saves:
+                    violations.append(
+                        f"{where}: {action['saves_per_run']} saves per run > {args.max_saves}"
+                    )
+            if args.max_gui_kdf is not None and name not in args.exempt:
+                if action["gui_thread_kdf_calls_per_run"] > args.max_gui_kdf:
+                    violations.append(
+                        f"{where}: {action['gui_thread_kdf_calls_per_run']} KDF runs on the GUI thread "
+                        f"per run > {args.max_gui_kdf}"
+                    )
+    return violations
+
+
+def parse_args(argv):
+    parser = argparse.ArgumentParser(description="Headless load test for the password manager UI")
+    parser.add_argument("--sizes", default="100,1000,5000",
+                        help="Comma-separated vault sizes to test (default: %(default)s)")
+    parser.add_argument("--repeat", type=int, default=5,
+                        help="How many times each action is repeated per vault (default: %(default)s)")
+    parser.add_argument("--bulk-size", type=int, default=BULK_SIZE,
+                        help="How many entries bulk actions select (default: %(default)s)")
+    parser.add_argument("--seed", type=int, default=0, help="Seed for the synthetic vaults")
+    parser.add_argument("--settle-ms", type=int, default=SETTLE_MS,
+                        help="How long to keep probing after each action (default: %(default)s)")
+    parser.add_argument("--tracemalloc", action="store_true",
+                        help="Also track peak Python allocations (slows the run down)")
+    parser.add_argument("--output", default="-", help="Report path, '-' for stdout (default)")
+    parser.add_argument("--max-stall-ms", type=float,
+                        help="Fail if any action stalls the event loop longer than this")
+    parser.add_argument("--max-list-rebuilds", type=float,
+                        help="Fail if a mutating action rebuilds the whole list more often than this per run")
+    parser.add_argument("--max-saves", type=float,
+                        help="Fail if a mutating action saves the vault more often than this per run")
+    parser.add_argument("--max-gui-kdf", type=float,
+                        help="Fail if an action runs the KDF on the GUI thread more often than this per run")
+    parser.add_argument("--exempt", default="",
+                        help="Comma-separated actions excluded from the stall and KDF budgets")
+    args = parser.parse_args(argv)
+    args.sizes = [int(size) for size in args.sizes.split(",") if size.strip()]
+    args.exempt = {name.strip() for name in args.exempt.split(",") if name.strip()}
+    return args
+
+
+def main(argv=None):
+    args = parse_args(sys.argv[1:] if argv is None else argv)
+
+    app = QApplication.instance() or QApplication(sys.argv[:1])
+    app.setStyle("Fusion")
+
+    counters = Counters()
+    instrument(counters)
+    dialogs = ScriptedDialogs(counters)
+
+    if args.tracemalloc:
+        tracemalloc.start()
+
+    load_test = LoadTest(app, counters, dialogs, args.settle_ms, args.tracemalloc)
+    report = {
+        "platform": os.environ.get("QT_QPA_PLATFORM"),
+        "python": platform.python_version(),
+        "qt": QT_VERSION_STR,
+        "pyqt": PYQT_VERSION_STR,
+        "heartbeat_ms": HEARTBEAT_MS,
+        "repeat": args.repeat,
+        "bulk_size": args.bulk_size,
+        "runs": []
+    }
+    for size in args.sizes:
+        report["runs"].append(load_test.run_vault(size, args.repeat, args.seed + size, args.bulk_size))
+
+    report["violations"] = check_budgets(report, args)
+
+    output = json.dumps(report, indent=2)
+    if args.output == "-":
+        print(output)
+    else:
+        with open(args.output, "w") as f:
+            f.write(output + "\n")
+
+    for violation in report["violations"]:
+        print(f"FAIL {violation}", file=sys.stderr)
+    return 1 if report["violations"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())